@@ -1,12 +1,22 @@
 import csv
+import mmap
+import os
 import types
 from pathlib import Path
 from typing import Any
 
+# 読み込みバッファサイズ（read()システムコールの回数を削減するため大きめに確保）
+READ_BUFFER_SIZE = 1 << 20
+
+# このサイズ以上のファイルはメモリマップして読み込む
+MMAP_THRESHOLD = 1 << 20
+
 
 class AIWolfCSVReader:
     """AIWolf CSVファイルを読み込むクラス."""
 
+    __slots__ = ("file_path", "encoding", "_file", "_mmap", "_source")
+
     def __init__(self, config: dict[str, Any], file_path: Path) -> None:
         if not file_path.is_file():
             msg = f"File not found: {file_path}"
@@ -15,31 +25,94 @@ class AIWolfCSVReader:
         self.file_path = file_path
         self.encoding = str(config["processing"]["encoding"])
         self._file = None
-        self._reader = None
+        self._mmap: mmap.mmap | None = None
+        # 行の読み込み元（ファイルまたはメモリマップ）
+        self._source = None
 
     def open(self) -> None:
-        """ファイルを開いてCSVリーダーを初期化."""
-        self._file = open(self.file_path, encoding=self.encoding)
-        self._reader = csv.reader(self._file)
+        """ファイルをバイナリモードで開く.
+
+        MMAP_THRESHOLD以上のファイルはメモリマップし、
+        ユーザー空間バッファへのコピーを省略する。
+        """
+        self._file = open(self.file_path, "rb", buffering=READ_BUFFER_SIZE)
+        self._source = self._file
+
+        if os.fstat(self._file.fileno()).st_size >= MMAP_THRESHOLD:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._source = self._mmap
 
     def read_next_line(self) -> list[str] | None:
         """次の行を読み込む."""
-        if self._reader is None:
+        lines = self.read_lines(1)
+        return lines[0] if lines else None
+
+    def read_lines(self, n: int = 1024) -> list[list[str]]:
+        """最大n行をまとめて読み込む.
+
+        引用符を含まない行はカンマで直接分割し、
+        引用符を含む行のみcsvモジュールで解析する。
+
+        Args:
+            n: 一度に読み込む最大行数
+
+        Returns:
+            読み込んだ行のリスト（ファイル末尾に達した場合は空リスト）
+        """
+        if self._source is None:
             raise RuntimeError("File not opened. Call open() first.")
-        try:
-            line = next(self._reader)
+
+        readline = self._source.readline
+        encoding = self.encoding
+        lines: list[list[str]] = []
+
+        for _ in range(n):
+            raw = readline()
+            if not raw:
+                break
+
+            if b'"' in raw:
+                lines.append(self._read_quoted_line(raw))
+                continue
+
+            line = raw.rstrip(b"\r\n").decode(encoding)
             if not line:
                 raise ValueError("Empty line found in CSV")
-            return line
-        except StopIteration:
-            return None
+            lines.append(line.split(","))
+
+        return lines
+
+    def _read_quoted_line(self, raw: bytes) -> list[str]:
+        """引用符を含む行をcsvモジュールで解析する.
+
+        引用符で囲まれたフィールドは改行を含む場合があるため、
+        後続の行はcsvモジュールが必要とした場合にのみ読み進める
+        （引用符の対応はcsvモジュール自身が判定する）。
+        """
+        readline = self._source.readline
+        encoding = self.encoding
+
+        def decoded_lines():
+            # テキストモードで読み込んだ場合と同様に改行をLFにそろえる
+            next_raw = raw
+            while next_raw:
+                line = next_raw.decode(encoding)
+                if line.endswith("\r\n"):
+                    line = line[:-2] + "\n"
+                yield line
+                next_raw = readline()
+
+        return next(csv.reader(decoded_lines()))
 
     def close(self) -> None:
         """ファイルを閉じる."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
         if self._file:
             self._file.close()
             self._file = None
-            self._reader = None
+        self._source = None
 
     def __enter__(self) -> "AIWolfCSVReader":
         """with文のサポート."""
@@ -139,8 +139,8 @@ class ActionTypes:
     GUARD = "guard"
     RESULT = "result"
 
-    # 会話系アクションのリスト（複数のアクションで共通の処理を行う場合に使用）
-    CONVERSATION_ACTIONS = [TALK, WHISPER]
+    # 会話系アクションの集合（複数のアクションで共通の処理を行う場合に使用）
+    CONVERSATION_ACTIONS = frozenset((TALK, WHISPER))
 
     # 全アクションのリスト
     ALL_ACTIONS = [TALK, WHISPER, STATUS, VOTE, DIVINE, EXECUTE, GUARD, RESULT]
@@ -17,6 +17,15 @@ class AIWolfGameLogError(Exception):
 class AIWolfGameLog:
     """AIWolfのゲームログ（ログファイルとJSONファイルのペア）を管理するクラス."""
 
+    __slots__ = (
+        "input_dir",
+        "log_path",
+        "json_path",
+        "_csv_reader",
+        "_json_reader",
+        "_game_id",
+    )
+
     def __init__(
         self,
         input_dir: Path,
@@ -27,13 +36,35 @@ class AIWolfGameLog:
         Args:
             input_dir: 入力ディレクトリのパス
             file_name: ファイル名（拡張子なし）
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        self._setup(
+            input_dir,
+            input_dir / "log" / f"{file_name}.log",
+            input_dir / "json" / f"{file_name}.json",
+            validate=True,
+        )
+
+    def _setup(
+        self, input_dir: Path, log_path: Path, json_path: Path, validate: bool
+    ) -> None:
+        """属性を初期化.
+
+        Args:
+            input_dir: 入力ディレクトリのパス
+            log_path: ログファイルのパス
+            json_path: JSONファイルのパス
+            validate: ファイルの存在確認を行うかどうか
         """
         self.input_dir = input_dir
-        self.log_path = input_dir / "log" / f"{file_name}.log"
-        self.json_path = input_dir / "json" / f"{file_name}.json"
+        self.log_path = log_path
+        self.json_path = json_path
 
         # ファイルの存在確認
-        self._validate_files()
+        if validate:
+            self._validate_files()
 
         # リーダーの初期化は遅延する
         self._csv_reader: AIWolfCSVReader | None = None
@@ -78,7 +109,8 @@ class AIWolfGameLog:
             encoding = "utf-8"  # デフォルト値
             if config and "processing" in config and "encoding" in config["processing"]:
                 encoding = config["processing"]["encoding"]
-            self._json_reader = AIWolfJSONReader(self.json_path, encoding)
+            # 存在確認は行わない（存在しない場合はread()時にFileNotFoundErrorとなる）
+            self._json_reader = AIWolfJSONReader.unchecked(self.json_path, encoding)
         return self._json_reader
 
     def read_json(self, config: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -147,5 +179,35 @@ class AIWolfGameLog:
         """入力ディレクトリとファイル名からインスタンスを作成."""
         return cls(input_dir=input_dir, file_name=file_name)
 
+    @classmethod
+    def from_paths(
+        cls,
+        input_dir: Path,
+        log_path: Path,
+        json_path: Path,
+        validate: bool = True,
+    ) -> Self:
+        """ログファイルとJSONファイルのパスから直接インスタンスを作成.
+
+        ディレクトリ走査などで得たパスをそのまま使用し、パスの再構築を省略する。
+
+        Args:
+            input_dir: 入力ディレクトリのパス
+            log_path: ログファイルのパス
+            json_path: JSONファイルのパス
+            validate: ファイルの存在確認を行うかどうか。
+                Falseの場合、ログファイルはCSVリーダーの生成時、
+                JSONファイルは読み込み時に初めて存在が確認される
+
+        Returns:
+            AIWolfGameLogインスタンス
+
+        Raises:
+            FileNotFoundError: validateがTrueでファイルが存在しない場合
+        """
+        game_log = cls.__new__(cls)
+        game_log._setup(input_dir, log_path, json_path, validate)
+        return game_log
+
     def __repr__(self) -> str:
         return f"AIWolfGameLog(game_id='{self.game_id}', log='{self.log_path}', json='{self.json_path}')"
@@ -1,16 +1,50 @@
 """JSONファイルからキャラクター情報を読み込むモジュール."""
 
 import json
+import sys
+from itertools import chain, repeat
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Self
 
 from aiwolf_nlp_common.packet import Request
 from src.game.models import PlayerInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# entries内のrequest文字列の解析関数
+# orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラスのため、例外処理は共通
+_loads = orjson.loads if orjson is not None else json.loads
+
+# agents配列の各要素からPlayerInfoの構築に必要な値を取り出す関数
+_AGENT_FIELDS = itemgetter("idx", "name", "team")
+
+# INITIALIZE requestの種別名（走査ループ内での列挙型の属性参照を避ける）
+_INIT_REQ: str = Request.INITIALIZE.value
+
+# INITIALIZE requestの候補を解析前に絞り込むための部分文字列
+_INITIALIZE_TOKEN = f'"{_INIT_REQ}"'
+
+
+def _intern(value: Any) -> Any:
+    """文字列の場合のみインターンする（nullなど文字列以外はそのまま返す）."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class AIWolfJSONReader:
     """AIWolfのJSONファイルを読み込むクラス."""
 
+    __slots__ = (
+        "file_path",
+        "encoding",
+        "_data",
+        "_initialize_scan",
+        "_agent_to_team",
+    )
+
     def __init__(self, file_path: Path, encoding: str = "utf-8"):
         """初期化
 
@@ -27,27 +61,64 @@ class AIWolfJSONReader:
         self.file_path = file_path
         self.encoding = encoding
         self._data: dict[str, Any] | None = None
+        self._initialize_scan: tuple[dict[str, str], list[str]] | None = None
+        self._agent_to_team: dict[str, str] | None = None
 
     @property
     def data(self) -> dict[str, Any]:
-        """データを取得（遅延読み込み）."""
-        if self._data is None:
-            self.read()
-        return self._data
+        """データを取得（遅延読み込み）.
+
+        __slots__を使用しているためfunctools.cached_propertyは使えない。
+        読み込み済みの場合は属性の参照と比較のみで返す。
+        """
+        data = self._data
+        return data if data is not None else self.read()
 
     def read(self) -> dict[str, Any]:
         """JSONファイルを読み込む
 
+        一度読み込んだデータはキャッシュされ、以降の呼び出しでは再解析しない。
+
         Returns:
             読み込んだデータ
 
         Raises:
             json.JSONDecodeError: JSONの解析に失敗した場合
         """
-        with open(self.file_path, "r", encoding=self.encoding) as f:
-            self._data = json.load(f)
+        if self._data is not None:
+            return self._data
+
+        # orjsonはUTF-8のバイト列を直接解析できるため、デコードを省略する
+        if orjson is not None and self.encoding.lower() in ("utf-8", "utf8"):
+            with open(self.file_path, "rb") as f:
+                self._data = orjson.loads(f.read())
+        else:
+            with open(self.file_path, "r", encoding=self.encoding) as f:
+                self._data = json.load(f)
         return self._data
 
+    @classmethod
+    def unchecked(cls, file_path: Path, encoding: str = "utf-8") -> Self:
+        """存在確認を行わずにリーダーを作成.
+
+        os.scandirでの列挙などにより、呼び出し側で存在が確認済みのパスに使用する。
+        ファイルが存在しない場合はread()時にFileNotFoundErrorとなる。
+
+        Args:
+            file_path: JSONファイルのパス
+            encoding: ファイルエンコーディング（デフォルト: utf-8）
+
+        Returns:
+            AIWolfJSONReaderインスタンス
+        """
+        reader = cls.__new__(cls)
+        reader.file_path = file_path
+        reader.encoding = encoding
+        reader._data = None
+        reader._initialize_scan = None
+        reader._agent_to_team = None
+        return reader
+
     @classmethod
     def from_log_path(cls, log_path: Path, encoding: str = "utf-8") -> Self:
         """ログファイルパスから対応するJSONファイルのリーダーを作成
@@ -74,13 +145,10 @@ class AIWolfJSONReader:
             PlayerInfoのリスト
         """
         agents = self.data.get("agents", [])
+        # 3つのキーを1回の呼び出しで取り出す
         return [
-            PlayerInfo(
-                index=agent["idx"],
-                full_team_name=agent["name"],
-                team=agent["team"],
-            )
-            for agent in agents
+            PlayerInfo(index, _intern(full_team_name), _intern(team))
+            for index, full_team_name, team in map(_AGENT_FIELDS, agents)
         ]
 
     def get_initialize_profiles(self) -> dict[str, str]:
@@ -89,29 +157,9 @@ class AIWolfJSONReader:
         Returns:
             エージェント名をキー、プロフィール文字列を値とする辞書
         """
-        profiles = {}
-        entries = self.data.get("entries", [])
-
-        for entry in entries:
-            try:
-                request_str = entry.get("request", "")
-                if not request_str:
-                    continue
-
-                request_data = json.loads(request_str)
-
-                if request_data.get("request") == Request.INITIALIZE.value:
-                    info = request_data.get("info", {})
-                    agent_name = info.get("agent")
-                    profile = info.get("profile")
-
-                    if agent_name and profile:
-                        profiles[agent_name] = profile
-
-            except (json.JSONDecodeError, KeyError, TypeError):
-                continue
-
-        return profiles
+        profiles, _ = self._scan_initialize_entries()
+        # 呼び出し側での変更がキャッシュに影響しないようコピーを返す
+        return dict(profiles)
 
     def get_agents_data(self) -> list[dict[str, Any]]:
         """agentsセクションの生データを取得.
@@ -143,59 +191,87 @@ class AIWolfJSONReader:
 
         logger = logging.getLogger(__name__)
 
-        agent_to_team = {}
-        entries = self.data.get("entries", [])
+        if self._agent_to_team is not None:
+            return dict(self._agent_to_team)
+
         agents_data = self.data.get("agents", [])
 
         # agents配列をidx順にソートしてチーム情報を取得
         agents_sorted = sorted(agents_data, key=lambda x: x["idx"])
-        team_list = [agent["team"] for agent in agents_sorted]
+        team_list = [_intern(agent["team"]) for agent in agents_sorted]
 
         # INITIALIZE requestからエージェント名を出現順に取得
+        _, agent_names_in_order = self._scan_initialize_entries()
+
+        # INITIALIZE requestの出現順序とagents配列の順序を対応付け
+        if len(agent_names_in_order) != len(team_list):
+            # 長さが一致しない場合、チーム情報が不足する分は"unknown"とする
+            logger.warning(
+                f"Agent names count ({len(agent_names_in_order)}) != teams count ({len(team_list)}). "
+                "Using fallback mapping."
+            )
+        agent_to_team = dict(
+            zip(agent_names_in_order, chain(team_list, repeat("unknown")))
+        )
+
+        self._agent_to_team = agent_to_team
+        return dict(agent_to_team)
+
+    def _scan_initialize_entries(self) -> tuple[dict[str, str], list[str]]:
+        """entriesを一度だけ走査し、INITIALIZE requestの情報を収集.
+
+        プロフィールとエージェント名の出現順を同じ走査で取得する。
+        同じエージェントのINITIALIZEが複数ある場合、プロフィールは最後のものを採用する。
+        結果はインスタンスにキャッシュされ、以降の呼び出しでは再走査しない。
+
+        Returns:
+            (エージェント名をキーとするプロフィール辞書, 重複を除いたエージェント名の出現順リスト)
+        """
+        if self._initialize_scan is not None:
+            return self._initialize_scan
+
+        data = self.data
+        profiles = {}
         agent_names_in_order = []
         processed_agents = set()
+        # ループ内での属性参照を避けるため、メソッドをローカル変数に束縛する
+        loads = _loads
+        add_processed = processed_agents.add
+        append_name = agent_names_in_order.append
 
-        for entry in entries:
+        for entry in data.get("entries", []):
             try:
                 request_str = entry.get("request", "")
-                if not request_str:
+                # INITIALIZEを含まないrequest（TALKなど大半）は解析自体を省略
+                if not request_str or _INITIALIZE_TOKEN not in request_str:
                     continue
 
-                request_data = json.loads(request_str)
+                request_data = loads(request_str)
+
+                if request_data.get("request") == _INIT_REQ:
+                    info = request_data.get("info")
+                    # infoがない場合は取得できる情報がないため、既定値の辞書を作らずに飛ばす
+                    if not info:
+                        continue
 
-                if request_data.get("request") == Request.INITIALIZE.value:
-                    info = request_data.get("info", {})
                     agent_name = info.get("agent")
+                    profile = info.get("profile")
 
-                    # 既に処理済みのエージェントはスキップ
+                    if agent_name and profile:
+                        profiles[agent_name] = profile
+
+                    # 既に処理済みのエージェントは出現順に追加しない
                     if not agent_name or agent_name in processed_agents:
                         continue
 
-                    processed_agents.add(agent_name)
-                    agent_names_in_order.append(agent_name)
+                    add_processed(agent_name)
+                    append_name(agent_name)
 
             except (json.JSONDecodeError, KeyError, TypeError):
                 continue
 
-        # INITIALIZE requestの出現順序とagents配列の順序を対応付け
-        # 両方の配列の長さが一致する場合のみマッピングを作成
-        if len(agent_names_in_order) == len(team_list):
-            for agent_name, team in zip(agent_names_in_order, team_list):
-                agent_to_team[agent_name] = team
-        else:
-            # 長さが一致しない場合、フォールバック：エージェント名からチーム名を推測
-            logger.warning(
-                f"Agent names count ({len(agent_names_in_order)}) != teams count ({len(team_list)}). "
-                "Using fallback mapping."
-            )
-            # 利用可能なチーム情報がある限りマッピングを作成
-            for i, agent_name in enumerate(agent_names_in_order):
-                if i < len(team_list):
-                    agent_to_team[agent_name] = team_list[i]
-                else:
-                    agent_to_team[agent_name] = "unknown"
-
-        return agent_to_team
+        self._initialize_scan = (profiles, agent_names_in_order)
+        return self._initialize_scan
 
     def get_character_info(self) -> dict[str, str]:
         """キャラクター情報を取得（get_initialize_profilesのエイリアス）
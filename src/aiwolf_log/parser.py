@@ -1,13 +1,84 @@
 from __future__ import annotations
 
+import sys
 from typing import Any
 
-from .csv_schema import CSVColumnIndices
+from .csv_schema import ActionTypes, CSVColumnIndices
+
+_CONVERSATION_SCHEMA: tuple[tuple[str, int], ...] = (
+    ("talk_number", CSVColumnIndices.ConversationAction.TALK_NUMBER),
+    ("talk_count", CSVColumnIndices.ConversationAction.TALK_COUNT),
+    ("speaker_index", CSVColumnIndices.ConversationAction.SPEAKER_INDEX),
+    ("text", CSVColumnIndices.ConversationAction.TEXT),
+)
+
+# アクション名から(出力キー, 列インデックス)の組へのスキーマ定義
+ACTION_SCHEMA: dict[str, tuple[tuple[str, int], ...]] = {
+    ActionTypes.TALK: _CONVERSATION_SCHEMA,
+    ActionTypes.WHISPER: _CONVERSATION_SCHEMA,
+    ActionTypes.STATUS: (
+        ("player_index", CSVColumnIndices.StatusAction.PLAYER_INDEX),
+        ("role", CSVColumnIndices.StatusAction.ROLE),
+        ("alive_status", CSVColumnIndices.StatusAction.ALIVE_STATUS),
+        ("team_name", CSVColumnIndices.StatusAction.TEAM_NAME),
+        ("player_name", CSVColumnIndices.StatusAction.PLAYER_NAME),
+    ),
+    ActionTypes.VOTE: (
+        ("voter_index", CSVColumnIndices.VoteAction.VOTER_INDEX),
+        ("target_index", CSVColumnIndices.VoteAction.TARGET_INDEX),
+    ),
+    ActionTypes.DIVINE: (
+        ("diviner_index", CSVColumnIndices.DivineAction.DIVINER_INDEX),
+        ("target_index", CSVColumnIndices.DivineAction.TARGET_INDEX),
+        ("divine_result", CSVColumnIndices.DivineAction.DIVINE_RESULT),
+    ),
+    ActionTypes.EXECUTE: (
+        (
+            "executed_player_index",
+            CSVColumnIndices.ExecuteAction.EXECUTED_PLAYER_INDEX,
+        ),
+        (
+            "executed_player_role",
+            CSVColumnIndices.ExecuteAction.EXECUTED_PLAYER_ROLE,
+        ),
+    ),
+    ActionTypes.GUARD: (
+        ("guard_player_index", CSVColumnIndices.GuardAction.GUARD_PLAYER_INDEX),
+        ("target_player_index", CSVColumnIndices.GuardAction.TARGET_PLAYER_INDEX),
+        ("target_player_role", CSVColumnIndices.GuardAction.TARGET_PLAYER_ROLE),
+    ),
+    ActionTypes.RESULT: (
+        ("villager_survivors", CSVColumnIndices.ResultAction.VILLAGER_SURVIVORS),
+        ("werewolf_survivors", CSVColumnIndices.ResultAction.WEREWOLF_SURVIVORS),
+        ("winning_team", CSVColumnIndices.ResultAction.WINNING_TEAM),
+    ),
+}
+
+# 役職・チーム名など値の種類が少ない列（行をまたいで同じ文字列が繰り返される）
+_CATEGORICAL_KEYS: frozenset[str] = frozenset(
+    (
+        "role",
+        "alive_status",
+        "team_name",
+        "divine_result",
+        "executed_player_role",
+        "target_player_role",
+        "winning_team",
+    )
+)
+
+# アクションごとにインターンする出力キー（該当なしのアクションは空タプル）
+_INTERN_KEYS: dict[str, tuple[str, ...]] = {
+    action: tuple(key for key, _ in schema if key in _CATEGORICAL_KEYS)
+    for action, schema in ACTION_SCHEMA.items()
+}
 
 
 class AIWolfCSVParser:
     """AIWolf CSVファイルのパースを行うクラス."""
 
+    __slots__ = ()
+
     def get_action(self, line: list[str]) -> str:
         """どの行動を意味する行なのか取得.
 
@@ -18,7 +89,6 @@ class AIWolfCSVParser:
             行動名（文字列）
 
         Raises:
-            TypeError: lineがリストでないか、要素が文字列でない場合
             ValueError: lineが空の場合
         """
         return self._get_element(line, CSVColumnIndices.ACTION)
@@ -33,10 +103,9 @@ class AIWolfCSVParser:
             日数（整数）
 
         Raises:
-            TypeError: lineがリストでないか、要素が文字列でない場合
             ValueError: lineが空の場合、または日数が整数に変換できない場合
         """
-        day_str = self._get_element(line=line, index=CSVColumnIndices.DAY)
+        day_str = self._get_element(line, CSVColumnIndices.DAY)
         try:
             return int(day_str)
         except ValueError as e:
@@ -54,20 +123,9 @@ class AIWolfCSVParser:
             指定されたインデックスの要素（文字列）
 
         Raises:
-            TypeError: lineがリストでないか、要素が文字列でない場合
             ValueError: lineが空の場合、またはindexが範囲外の場合
         """
-        if not isinstance(line, list):
-            msg = f"Line must be a list, got {type(line).__name__}"
-            raise TypeError(msg)
-
-        if not all(isinstance(elem, str) for elem in line):
-            invalid_types = [
-                type(elem).__name__ for elem in line if not isinstance(elem, str)
-            ]
-            msg = f"All elements in line must be strings, found: {', '.join(set(invalid_types))}"
-            raise TypeError(msg)
-
+        # 行はCSVリーダーから渡されるため要素の型検査は行わない（ホットパス）
         if len(line) == 0:
             msg = "Line cannot be empty"
             raise ValueError(msg)
@@ -82,6 +140,25 @@ class AIWolfCSVParser:
 
         return line[index]
 
+    def _validate_line(self, line: list[str]) -> None:
+        """行の型を一度だけ検証する.
+
+        要素ごとの検査は行わず、行がリストであることと先頭要素の型のみを確認する。
+
+        Args:
+            line: CSV行のデータ（文字列のリスト）
+
+        Raises:
+            TypeError: lineがリストでないか、先頭要素が文字列でない場合
+        """
+        if not isinstance(line, list):
+            msg = f"Line must be a list, got {type(line).__name__}"
+            raise TypeError(msg)
+
+        if line and not isinstance(line[0], str):
+            msg = f"Elements in line must be strings, found: {type(line[0]).__name__}"
+            raise TypeError(msg)
+
     def parse_action_data(self, line: list[str]) -> dict[str, Any]:
         """actionに応じて適切なデータを解析してdictとして返す.
 
@@ -92,11 +169,13 @@ class AIWolfCSVParser:
             解析されたデータのdict
 
         Raises:
-            TypeError: lineがリストでないか、要素が文字列でない場合
-            ValueError: lineが空の場合、または解析に失敗した場合
+            ValueError: lineがリストでない場合、空の場合、または解析に失敗した場合
         """
         try:
-            action = self.get_action(line).lower()
+            # 行単位の検証は解析の最初に一度だけ行う
+            self._validate_line(line)
+            # アクション名は全行で繰り返されるためインターンして共有する
+            action = sys.intern(self.get_action(line).lower())
             base_data = {"day": self.get_day(line), "action": action}
 
             # action別の追加データを取得
@@ -118,109 +197,15 @@ class AIWolfCSVParser:
         Returns:
             action固有のデータdict
         """
-        action_parsers = {
-            "talk": self._parse_conversation_action,
-            "whisper": self._parse_conversation_action,
-            "status": self._parse_status_action,
-            "vote": self._parse_vote_action,
-            "divine": self._parse_divine_action,
-            "execute": self._parse_execute_action,
-            "guard": self._parse_guard_action,
-            "result": self._parse_result_action,
-        }
-
-        parser_func = action_parsers.get(action)
-        return parser_func(line) if parser_func else {}
-
-    def _parse_conversation_action(self, line: list[str]) -> dict[str, str]:
-        """会話系アクション（talk/whisper）のデータを解析."""
-        conv = CSVColumnIndices.ConversationAction
-        return {
-            "talk_number": self._get_element_safe(line, conv.TALK_NUMBER),
-            "talk_count": self._get_element_safe(line, conv.TALK_COUNT),
-            "speaker_index": self._get_element_safe(line, conv.SPEAKER_INDEX),
-            "text": self._get_element_safe(line, conv.TEXT),
-        }
-
-    def _parse_status_action(self, line: list[str]) -> dict[str, str]:
-        """statusアクションのデータを解析."""
-        status = CSVColumnIndices.StatusAction
-        return {
-            "player_index": self._get_element_safe(line, status.PLAYER_INDEX),
-            "role": self._get_element_safe(line, status.ROLE),
-            "alive_status": self._get_element_safe(line, status.ALIVE_STATUS),
-            "team_name": self._get_element_safe(line, status.TEAM_NAME),
-            "player_name": self._get_element_safe(line, status.PLAYER_NAME),
-        }
-
-    def _parse_vote_action(self, line: list[str]) -> dict[str, str]:
-        """voteアクションのデータを解析."""
-        vote = CSVColumnIndices.VoteAction
-        return {
-            "voter_index": self._get_element_safe(line, vote.VOTER_INDEX),
-            "target_index": self._get_element_safe(line, vote.TARGET_INDEX),
-        }
-
-    def _parse_divine_action(self, line: list[str]) -> dict[str, str]:
-        """divineアクションのデータを解析."""
-        divine = CSVColumnIndices.DivineAction
-        return {
-            "diviner_index": self._get_element_safe(line, divine.DIVINER_INDEX),
-            "target_index": self._get_element_safe(line, divine.TARGET_INDEX),
-            "divine_result": self._get_element_safe(line, divine.DIVINE_RESULT),
-        }
-
-    def _parse_execute_action(self, line: list[str]) -> dict[str, str]:
-        """executeアクションのデータを解析."""
-        execute = CSVColumnIndices.ExecuteAction
-        return {
-            "executed_player_index": self._get_element_safe(
-                line, execute.EXECUTED_PLAYER_INDEX
-            ),
-            "executed_player_role": self._get_element_safe(
-                line, execute.EXECUTED_PLAYER_ROLE
-            ),
-        }
-
-    def _parse_guard_action(self, line: list[str]) -> dict[str, str]:
-        """guardアクションのデータを解析."""
-        guard = CSVColumnIndices.GuardAction
-        return {
-            "guard_player_index": self._get_element_safe(
-                line, guard.GUARD_PLAYER_INDEX
-            ),
-            "target_player_index": self._get_element_safe(
-                line, guard.TARGET_PLAYER_INDEX
-            ),
-            "target_player_role": self._get_element_safe(
-                line, guard.TARGET_PLAYER_ROLE
-            ),
-        }
-
-    def _parse_result_action(self, line: list[str]) -> dict[str, str]:
-        """resultアクションのデータを解析."""
-        result = CSVColumnIndices.ResultAction
-        return {
-            "villager_survivors": self._get_element_safe(
-                line, result.VILLAGER_SURVIVORS
-            ),
-            "werewolf_survivors": self._get_element_safe(
-                line, result.WEREWOLF_SURVIVORS
-            ),
-            "winning_team": self._get_element_safe(line, result.WINNING_TEAM),
-        }
-
-    def _get_element_safe(self, line: list[str], index: int) -> str:
-        """安全に要素を取得する（インデックス範囲外の場合は空文字を返す）.
-
-        Args:
-            line: CSV行のデータ
-            index: 取得したいインデックス
-
-        Returns:
-            要素の値、または空文字
-        """
-        try:
-            return self._get_element(line, index)
-        except (ValueError, TypeError):
-            return ""
+        schema = ACTION_SCHEMA.get(action)
+        if not schema:
+            return {}
+
+        # 列が不足している場合は空文字とする
+        n = len(line)
+        data = {key: line[index] if index < n else "" for key, index in schema}
+
+        # 役職やチーム名は同じ文字列を共有させ、行ごとのメモリ消費を抑える
+        for key in _INTERN_KEYS[action]:
+            data[key] = sys.intern(data[key])
+        return data
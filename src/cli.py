@@ -1,9 +1,11 @@
 import argparse
 import logging
 from pathlib import Path
-import yaml
 
+from src.evaluation.loaders.criteria_loader import CriteriaLoader
+from src.evaluation.loaders.settings_loader import SettingsLoader
 from src.processor.batch_processor import BatchProcessor
+from src.utils.yaml_loader import YAMLLoader
 
 
 def setup_logging() -> None:
@@ -39,23 +41,31 @@ def main() -> None:
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # 設定ファイルの検証
-    if not args.config.is_file():
-        raise FileNotFoundError(f"設定ファイルが見つかりません: {args.config}")
-
     # 設定ファイルの読み込み
     try:
-        with args.config.open("r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-            logging.info(f"設定ファイルを読み込みました: {args.config}")
+        config = YAMLLoader.parse_file(
+            args.config, f"設定ファイルが見つかりません: {args.config}"
+        )
+        logging.info(f"設定ファイルを読み込みました: {args.config}")
+    except FileNotFoundError:
+        raise
     except Exception as e:
         raise RuntimeError(f"設定ファイルの読み込みに失敗しました: {e}")
 
     # settings_pathを設定に追加
     config["settings_path"] = str(args.config)
 
+    # 評価基準は実行中に変わらないため起動時に一度だけ読み込み、各ゲームの処理に渡す
+    # 読み込みに失敗した場合は従来どおり各ゲームの処理時に読み込む（エラーもそこで報告される）
+    evaluation_config = None
+    try:
+        criteria_path = SettingsLoader.get_evaluation_criteria_path(args.config)
+        evaluation_config = CriteriaLoader.load_evaluation_config(criteria_path)
+    except (FileNotFoundError, ValueError) as e:
+        logging.warning(f"評価基準の事前読み込みに失敗しました: {e}")
+
     # バッチ処理の実行
-    processor = BatchProcessor(config)
+    processor = BatchProcessor(config, evaluation_config)
 
     if args.regenerate_aggregation:
         # 集計再生成モード
@@ -66,11 +66,10 @@ class BaseEvaluator(ABC):
         Raises:
             ValueError: 評価レスポンスが不正な場合
         """
-        expected_criteria = self.config.get_criteria_for_game(player_count)
-        expected_names = {c.name for c in expected_criteria}
+        expected_names = self.config.get_criteria_names_for_game(player_count)
 
         # 不足している基準をチェック
-        actual_names = set(responses.keys())
+        actual_names = responses.keys()
         missing_criteria = expected_names - actual_names
         if missing_criteria:
             raise ValueError(f"Missing evaluations for criteria: {missing_criteria}")
@@ -82,10 +81,9 @@ class BaseEvaluator(ABC):
 
         # 各評価の基本的な整合性チェック（rankingの重複など）
         for criteria_name, response in responses.items():
-            rankings = [elem.ranking for elem in response.rankings]
-
-            # ランキングに重複がないかチェック
-            if len(set(rankings)) != len(rankings):
+            # ランキングに重複がないかチェック（中間リストを作らず集合のみ作成）
+            elements = response.rankings
+            if len({elem.ranking for elem in elements}) != len(elements):
                 raise ValueError(
                     f"Duplicate rankings found in criteria '{criteria_name}'"
                 )
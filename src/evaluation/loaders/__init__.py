@@ -1,6 +1,6 @@
 """評価設定ファイル読み込み専用モジュール."""
 
 from .criteria_loader import CriteriaLoader
-from .settings_loader import SettingsLoader
+from .settings_loader import SettingsBundle, SettingsLoader
 
-__all__ = ["SettingsLoader", "CriteriaLoader"]
+__all__ = ["SettingsLoader", "SettingsBundle", "CriteriaLoader"]
@@ -1,6 +1,9 @@
 """Evaluation criteria.yaml 専用ローダー."""
 
 import re
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 from src.evaluation.models import (
@@ -11,6 +14,15 @@ from src.evaluation.models import (
 )
 from src.utils.yaml_loader import YAMLLoader
 
+# ゲーム固有基準のキー（例: "13_player"）からプレイヤー数を取り出すパターン
+_PLAYER_COUNT_RE = re.compile(r"(\d+)")
+
+# YAML上の文字列からRankingTypeへの対応
+_RANKING_TYPE_MAP: dict[str, RankingType] = {
+    "ordinal": RankingType.ORDINAL,
+    "comparative": RankingType.COMPARATIVE,
+}
+
 
 class CriteriaLoader:
     """evaluation_criteria.yamlファイルの読み込み専用クラス."""
@@ -19,6 +31,9 @@ class CriteriaLoader:
     def load_evaluation_config(config_path: Path) -> EvaluationConfig:
         """評価設定ファイルを読み込んでEvaluationConfigオブジェクトを作成
 
+        同じファイルは更新時刻・サイズが変わるまで作成済みの評価設定を返す。
+        返される評価設定は呼び出し間で共有されるため、変更しないこと。
+
         Args:
             config_path: 設定ファイルのパス
 
@@ -29,8 +44,21 @@ class CriteriaLoader:
             FileNotFoundError: 設定ファイルが見つからない場合
             ValueError: 設定ファイルの形式が不正な場合
         """
-        config_data = YAMLLoader.load_yaml(config_path)
+        return _load_evaluation_config_cached(*YAMLLoader.get_cache_key(config_path))
+
+    @staticmethod
+    def build_evaluation_config(config_data: dict) -> EvaluationConfig:
+        """読み込み済みの評価設定データからEvaluationConfigオブジェクトを作成
 
+        Args:
+            config_data: evaluation_criteria.yamlの内容
+
+        Returns:
+            評価設定
+
+        Raises:
+            ValueError: 設定データの形式が不正な場合
+        """
         # 全評価基準を統合したリストを作成
         all_criteria = []
 
@@ -58,17 +86,15 @@ class CriteriaLoader:
         Returns:
             共通評価基準のリスト
         """
-        criteria_list = []
-        for criteria_dict in common_criteria_data:
-            # applicable_gamesから取得、なければデフォルトの[5, 13]
-            applicable_games = criteria_dict.get("applicable_games", [5, 13])
-            criteria = CriteriaLoader._load_criteria_dict(
+        # applicable_gamesから取得、なければデフォルトの(5, 13)
+        return [
+            CriteriaLoader._load_criteria_dict(
                 criteria_dict,
-                applicable_games,
+                criteria_dict.get("applicable_games", (5, 13)),
                 CriteriaCategory.COMMON,
             )
-            criteria_list.append(criteria)
-        return criteria_list
+            for criteria_dict in common_criteria_data
+        ]
 
     @staticmethod
     def _load_specific_criteria(specific_data: dict) -> list[EvaluationCriteria]:
@@ -88,16 +114,21 @@ class CriteriaLoader:
         for player_count_str, criteria_list_data in specific_data.items():
             try:
                 # より柔軟なパース（例: "13_player", "13-player", "13"）
-                match = re.search(r"(\d+)", player_count_str)
+                match = _PLAYER_COUNT_RE.search(player_count_str)
                 if not match:
                     raise ValueError(f"No player count found in: {player_count_str}")
 
-                player_count = int(match.group(1))
-                for criteria_dict in criteria_list_data:
-                    criteria = CriteriaLoader._load_criteria_dict(
-                        criteria_dict, [player_count], CriteriaCategory.GAME_SPECIFIC
-                    )
-                    criteria_list.append(criteria)
+                applicable_games = (int(match.group(1)),)
+                criteria_list.extend(
+                    [
+                        CriteriaLoader._load_criteria_dict(
+                            criteria_dict,
+                            applicable_games,
+                            CriteriaCategory.GAME_SPECIFIC,
+                        )
+                        for criteria_dict in criteria_list_data
+                    ]
+                )
             except (ValueError, AttributeError) as e:
                 raise ValueError(
                     f"Invalid player count format '{player_count_str}': {e}"
@@ -107,13 +138,15 @@ class CriteriaLoader:
 
     @staticmethod
     def _load_criteria_dict(
-        criteria_dict: dict, applicable_games: list[int], category: CriteriaCategory
+        criteria_dict: dict,
+        applicable_games: Iterable[int],
+        category: CriteriaCategory,
     ) -> EvaluationCriteria:
         """評価基準辞書を読み込んでEvaluationCriteriaオブジェクトを作成
 
         Args:
             criteria_dict: YAML から読み込まれた評価基準データ
-            applicable_games: この基準が適用されるプレイヤー数のリスト
+            applicable_games: この基準が適用されるプレイヤー数
             category: 評価基準のカテゴリー
 
         Returns:
@@ -125,22 +158,24 @@ class CriteriaLoader:
         try:
             name = criteria_dict["name"]
             description = criteria_dict["description"]
+            # 基準名・説明は全ゲームで繰り返し参照されるためインターンする
+            if isinstance(name, str):
+                name = sys.intern(name)
+            if isinstance(description, str):
+                description = sys.intern(description)
             ranking_type = criteria_dict["ranking_type"]
             order = criteria_dict.get("order", 0)  # デフォルト値0
 
             # 文字列をRankingType enumに変換
-            if ranking_type == "ordinal":
-                ranking_type_enum = RankingType.ORDINAL
-            elif ranking_type == "comparative":
-                ranking_type_enum = RankingType.COMPARATIVE
-            else:
+            ranking_type_enum = _RANKING_TYPE_MAP.get(ranking_type)
+            if ranking_type_enum is None:
                 raise ValueError(f"Invalid ranking type: {ranking_type}")
 
             return EvaluationCriteria(
                 name=name,
                 description=description,
                 ranking_type=ranking_type_enum,
-                applicable_games=applicable_games,
+                applicable_games=tuple(applicable_games),
                 category=category,
                 order=order,
             )
@@ -149,3 +184,25 @@ class CriteriaLoader:
             raise ValueError(f"Missing required field in criteria: {e}")
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid criteria data: {e}")
+
+
+@lru_cache(maxsize=8)
+def _load_evaluation_config_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> EvaluationConfig:
+    """評価設定ファイルからEvaluationConfigを作成する（YAMLと同じキーでキャッシュ）.
+
+    Args:
+        path_str: 設定ファイルの絶対パス
+        mtime_ns: ファイルの更新時刻（ナノ秒）。キャッシュの無効化にのみ使用
+        size: ファイルサイズ。キャッシュの無効化にのみ使用
+
+    Returns:
+        読み込まれた評価設定
+
+    Raises:
+        FileNotFoundError: 設定ファイルが見つからない場合
+        ValueError: 設定ファイルの形式が不正な場合
+    """
+    config_data = YAMLLoader.load_yaml(Path(path_str))
+    return CriteriaLoader.build_evaluation_config(config_data)
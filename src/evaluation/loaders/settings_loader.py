@@ -1,37 +1,119 @@
 """Settings.yaml 専用ローダー."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple
 
 from src.game.models import GameFormat
 from src.utils.yaml_loader import YAMLLoader
 
+_MISSING = object()
+
+
+def _dig(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """ネストした辞書をキーの順にたどって値を取得.
+
+    途中のキーがない場合や値が辞書でない場合は、空の辞書を作らずにdefaultを返す。
+
+    Args:
+        data: 対象の辞書
+        *keys: たどるキーの並び
+        default: 値が見つからない場合の既定値
+
+    Returns:
+        見つかった値、またはdefault
+    """
+    current: Any = data
+    for key in keys:
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
+            return default
+    return current
+
+
+@lru_cache(maxsize=16)
+def _to_game_format(value: str) -> GameFormat:
+    """文字列からGameFormatを取得（結果をキャッシュ）.
+
+    Args:
+        value: ゲーム形式の文字列
+
+    Returns:
+        ゲーム形式
+
+    Raises:
+        ValueError: 未知のゲーム形式の場合
+    """
+    return GameFormat(value)
+
+
+class SettingsBundle(NamedTuple):
+    """settings.yamlから一度に読み込んだ設定一式."""
+
+    player_count: int
+    game_format: GameFormat
+
 
 class SettingsLoader:
     """settings.yamlファイルの読み込み専用クラス."""
 
     @staticmethod
-    def load_player_count(settings_path: Path) -> int:
-        """settings.yamlからプレイヤー数を読み込む
+    def _load_settings(settings_path: Path) -> dict[str, Any]:
+        """settings.yamlを読み込む
+
+        解析結果はYAMLLoaderでキャッシュされるため、各項目の取得で再解析しない。
+        返される辞書は共有されるため変更しないこと。
 
         Args:
             settings_path: settings.yamlファイルのパス
 
         Returns:
-            読み込まれたプレイヤー数
+            settings.yamlの内容
 
         Raises:
             FileNotFoundError: 設定ファイルが見つからない場合
             ValueError: 設定ファイルの形式が不正な場合
         """
-        settings_data = YAMLLoader.load_yaml(settings_path)
+        return YAMLLoader.load_yaml(settings_path)
 
-        # プレイヤー数設定を取得
-        player_count = settings_data.get("game", {}).get("player_count", 5)
+    @staticmethod
+    def load_settings_bundle(settings_path: Path) -> SettingsBundle:
+        """settings.yamlを一度だけ読み込み、プレイヤー数とゲーム形式をまとめて取得
 
-        if not isinstance(player_count, int) or player_count <= 0:
-            raise ValueError(f"Invalid player count: {player_count}")
+        Args:
+            settings_path: settings.yamlファイルのパス
 
-        return player_count
+        Returns:
+            プレイヤー数・ゲーム形式をまとめたSettingsBundle
+
+        Raises:
+            FileNotFoundError: 設定ファイルが見つからない場合
+            ValueError: 設定ファイルの形式が不正な場合
+        """
+        settings_data = SettingsLoader._load_settings(settings_path)
+        return SettingsBundle(
+            player_count=SettingsLoader._parse_player_count(settings_data),
+            game_format=SettingsLoader._parse_game_format(settings_data),
+        )
+
+    @staticmethod
+    def load_player_count(settings_path: Path) -> int:
+        """settings.yamlからプレイヤー数を読み込む
+
+        Args:
+            settings_path: settings.yamlファイルのパス
+
+        Returns:
+            読み込まれたプレイヤー数
+
+        Raises:
+            FileNotFoundError: 設定ファイルが見つからない場合
+            ValueError: 設定ファイルの形式が不正な場合
+        """
+        settings_data = SettingsLoader._load_settings(settings_path)
+        return SettingsLoader._parse_player_count(settings_data)
 
     @staticmethod
     def load_game_format(settings_path: Path) -> GameFormat:
@@ -47,15 +129,8 @@ class SettingsLoader:
             FileNotFoundError: 設定ファイルが見つからない場合
             ValueError: 設定ファイルの形式が不正な場合
         """
-        settings_data = YAMLLoader.load_yaml(settings_path)
-
-        # ゲーム形式設定を取得
-        game_format_str = settings_data.get("game", {}).get("format", "main_match")
-
-        try:
-            return GameFormat(game_format_str)
-        except ValueError:
-            raise ValueError(f"Unknown game format: {game_format_str}")
+        settings_data = SettingsLoader._load_settings(settings_path)
+        return SettingsLoader._parse_game_format(settings_data)
 
     @staticmethod
     def get_evaluation_criteria_path(settings_path: Path) -> Path:
@@ -71,12 +146,74 @@ class SettingsLoader:
             FileNotFoundError: 設定ファイルが見つからない場合
             ValueError: 設定ファイルの形式が不正な場合
         """
-        settings_data = YAMLLoader.load_yaml(settings_path)
+        settings_data = SettingsLoader._load_settings(settings_path)
+        return SettingsLoader._parse_evaluation_criteria_path(
+            settings_data, settings_path
+        )
 
-        # evaluation_criteria のパスを取得
-        evaluation_criteria_path = settings_data.get("path", {}).get(
-            "evaluation_criteria"
+    @staticmethod
+    def _parse_player_count(settings_data: dict[str, Any]) -> int:
+        """設定データからプレイヤー数を取得
+
+        Args:
+            settings_data: settings.yamlの内容
+
+        Returns:
+            プレイヤー数
+
+        Raises:
+            ValueError: プレイヤー数が不正な場合
+        """
+        # プレイヤー数設定を取得
+        player_count = _dig(settings_data, "game", "player_count", default=5)
+
+        if not isinstance(player_count, int) or player_count <= 0:
+            raise ValueError(f"Invalid player count: {player_count}")
+
+        return player_count
+
+    @staticmethod
+    def _parse_game_format(settings_data: dict[str, Any]) -> GameFormat:
+        """設定データからゲーム形式を取得
+
+        Args:
+            settings_data: settings.yamlの内容
+
+        Returns:
+            ゲーム形式
+
+        Raises:
+            ValueError: 未知のゲーム形式の場合
+        """
+        # ゲーム形式設定を取得
+        game_format_str = _dig(
+            settings_data, "game", "format", default="main_match"
         )
+
+        try:
+            return _to_game_format(game_format_str)
+        except (ValueError, TypeError):
+            # TypeErrorはキャッシュのキーにできない値（リストなど）の場合
+            raise ValueError(f"Unknown game format: {game_format_str}")
+
+    @staticmethod
+    def _parse_evaluation_criteria_path(
+        settings_data: dict[str, Any], settings_path: Path
+    ) -> Path:
+        """設定データから評価基準ファイルのパスを取得
+
+        Args:
+            settings_data: settings.yamlの内容
+            settings_path: settings.yamlファイルのパス（相対パスの解決に使用）
+
+        Returns:
+            評価基準ファイルの絶対パス
+
+        Raises:
+            ValueError: 評価基準ファイルのパスが設定されていない場合
+        """
+        # evaluation_criteria のパスを取得
+        evaluation_criteria_path = _dig(settings_data, "path", "evaluation_criteria")
         if not evaluation_criteria_path:
             raise ValueError("evaluation_criteria path not found in settings")
 
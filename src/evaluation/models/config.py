@@ -1,23 +1,53 @@
+from collections.abc import Iterable
+
 from src.evaluation.models.criteria import EvaluationCriteria
 
 
 class EvaluationConfig(list[EvaluationCriteria]):
-    """評価設定を表すクラス（EvaluationCriteriaのリストを継承）."""
+    """評価設定を表すクラス（EvaluationCriteriaのリストを継承）.
+
+    プレイヤー数ごとの評価基準の索引を初期化時に構築する。
+    索引は初期化後のリスト操作では更新されない。
+    """
+
+    def __init__(self, criteria: Iterable[EvaluationCriteria] = ()):
+        """初期化
+
+        Args:
+            criteria: 評価基準
+        """
+        super().__init__(criteria)
+        self._by_game: dict[int, list[EvaluationCriteria]] = {}
+        self._by_game_name: dict[tuple[int, str], EvaluationCriteria] = {}
+        for c in self:
+            # applicable_gamesに重複があっても基準は一度だけ登録する
+            for player_count in c.applicable_games_set:
+                self._by_game.setdefault(player_count, []).append(c)
+                # 同名の基準が複数ある場合は、従来の線形探索と同じく先頭を優先する
+                self._by_game_name.setdefault((player_count, c.name), c)
+
+        # 検証で繰り返し使う基準名の集合もプレイヤー数ごとに一度だけ作成する
+        self._names_by_game: dict[int, frozenset[str]] = {
+            player_count: frozenset(c.name for c in criteria)
+            for player_count, criteria in self._by_game.items()
+        }
 
     def get_criteria_for_game(self, player_count: int) -> list[EvaluationCriteria]:
         """指定されたプレイヤー数の評価基準を取得."""
-        return [
-            criteria for criteria in self if player_count in criteria.applicable_games
-        ]
+        # 索引のリストを呼び出し側の変更から守るためコピーを返す
+        return list(self._by_game.get(player_count, ()))
+
+    def get_criteria_names_for_game(self, player_count: int) -> frozenset[str]:
+        """指定されたプレイヤー数の評価基準名の集合を取得."""
+        return self._names_by_game.get(player_count, frozenset())
 
     def get_criteria_by_name(
         self, criteria_name: str, player_count: int
     ) -> EvaluationCriteria:
         """基準名で評価基準を取得."""
-        all_criteria = self.get_criteria_for_game(player_count)
-        for criteria in all_criteria:
-            if criteria.name == criteria_name:
-                return criteria
-        raise KeyError(
-            f"Criteria '{criteria_name}' not found for player count {player_count}"
-        )
+        criteria = self._by_game_name.get((player_count, criteria_name))
+        if criteria is None:
+            raise KeyError(
+                f"Criteria '{criteria_name}' not found for player count {player_count}"
+            )
+        return criteria
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -16,13 +16,24 @@ class CriteriaCategory(Enum):
     GAME_SPECIFIC = "game_specific"  # ゲーム形式固有
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationCriteria:
     """評価基準を表すデータクラス."""
 
     name: str
     description: str
     ranking_type: RankingType
-    applicable_games: list[int]
+    applicable_games: tuple[int, ...]
     category: CriteriaCategory
     order: int = 0
+    # applicable_gamesの重複を除いた集合（__post_init__で構築）
+    applicable_games_set: frozenset[int] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """派生フィールドを初期化."""
+        # frozenのため通常の代入はできない
+        object.__setattr__(
+            self, "applicable_games_set", frozenset(self.applicable_games)
+        )
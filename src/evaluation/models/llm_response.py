@@ -1,12 +1,14 @@
 """LLMレスポンス関連のデータモデル."""
 
 from typing import Self
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class EvaluationElement(BaseModel):
     """個々のプレイヤーに対する評価要素."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     player_name: str = Field(description="評価対象者の名前")
     reasoning: str = Field(description="各評価対象に対する順位付けの理由")
     ranking: int = Field(
@@ -17,6 +19,8 @@ class EvaluationElement(BaseModel):
 class EvaluationLLMResponse(BaseModel):
     """LLMからの評価レスポンス全体."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     rankings: list[EvaluationElement] = Field(description="各プレイヤーに対する評価")
 
     @model_validator(mode="after")
@@ -26,18 +30,32 @@ class EvaluationLLMResponse(BaseModel):
         if not self.rankings:
             raise ValueError("ランキングリストは空にできません")
 
-        # ランキング値の重複チェック
-        ranking_values = [elem.ranking for elem in self.rankings]
-        if len(ranking_values) != len(set(ranking_values)):
-            raise ValueError("ランキング値に重複があります")
-
-        # ランキング値が連続した整数（1, 2, 3, ...）であることを検証
-        expected_rankings = set(range(1, len(self.rankings) + 1))
-        actual_rankings = set(ranking_values)
-        if actual_rankings != expected_rankings:
+        # ランキング値の重複と連続性（1, 2, 3, ...）を一度の走査で検証する
+        # 出現した順位をビットで記録し、集合やリストを生成しない
+        n = len(self.rankings)
+        mask = 0
+        # 範囲外の値はビットに含めず（巨大な整数の生成を避ける）、出現時のみ集合で重複を確認する
+        out_of_range: set[int] | None = None
+        for elem in self.rankings:
+            ranking = elem.ranking
+            if not 1 <= ranking <= n:
+                if out_of_range is None:
+                    out_of_range = set()
+                elif ranking in out_of_range:
+                    raise ValueError("ランキング値に重複があります")
+                out_of_range.add(ranking)
+                continue
+            bit = 1 << (ranking - 1)
+            if mask & bit:
+                raise ValueError("ランキング値に重複があります")
+            mask |= bit
+
+        if out_of_range or mask != (1 << n) - 1:
+            # エラーメッセージ用の集合はエラー時のみ作成する
+            actual_rankings = {elem.ranking for elem in self.rankings}
             raise ValueError(
-                f"ランキングは1から{len(self.rankings)}までの連続した整数である必要があります。"
-                f"実際: {sorted(actual_rankings)}, 期待: {sorted(expected_rankings)}"
+                f"ランキングは1から{n}までの連続した整数である必要があります。"
+                f"実際: {sorted(actual_rankings)}, 期待: {list(range(1, n + 1))}"
             )
 
         return self
@@ -47,14 +65,14 @@ class EvaluationLLMResponse(BaseModel):
         cls,
         rankings: list[EvaluationElement],
         player_count: int,
-        valid_player_names: set[str],
+        valid_player_names: frozenset[str],
     ) -> Self:
         """バリデーション付きでインスタンスを作成
 
         Args:
             rankings: ランキングデータ
             player_count: 期待するプレイヤー数
-            valid_player_names: 有効なプレイヤー名のセット
+            valid_player_names: 有効なプレイヤー名の集合（ゲームごとに一度だけ作成する）
 
         Returns:
             検証済みのEvaluationLLMResponseインスタンス
@@ -68,22 +86,33 @@ class EvaluationLLMResponse(BaseModel):
                 f"ランキング数（{len(rankings)}）がプレイヤー数（{player_count}）と一致しません"
             )
 
-        # プレイヤー名の検証
-        response_player_names = {elem.player_name for elem in rankings}
-        invalid_names = response_player_names - valid_player_names
+        # プレイヤー名の検証（一度の走査で有効な名前と無効な名前を振り分ける）
+        seen_names = set()
+        invalid_names = set()
+        for elem in rankings:
+            player_name = elem.player_name
+            if player_name in valid_player_names:
+                seen_names.add(player_name)
+            else:
+                invalid_names.add(player_name)
+
         if invalid_names:
             raise ValueError(
                 f"無効なプレイヤー名が含まれています: {invalid_names}. "
-                f"有効な名前: {valid_player_names}"
+                f"有効な名前: {set(valid_player_names)}"
             )
 
-        missing_names = valid_player_names - response_player_names
-        if missing_names:
+        # 全員分揃っている場合は差集合を計算しない
+        if len(seen_names) != len(valid_player_names):
+            missing_names = set(valid_player_names) - seen_names
             raise ValueError(f"不足しているプレイヤー名があります: {missing_names}")
 
         # 基本的なPydanticバリデーションを実行
         return cls(rankings=rankings)
 
+    # 以下はリストのように扱うためのラッパー
+    # 大量の要素を処理する箇所ではrankingsを直接参照すること
+    # （クラスのdocstringはJSONスキーマのdescriptionとしてLLMに送られるため、ここに記載する）
     def __iter__(self):
         """リストのように反復処理可能にする."""
         return iter(self.rankings)
@@ -1,33 +1,41 @@
+from array import array
+from dataclasses import dataclass
+from collections.abc import Iterable
 from typing import Self, Optional, TypeAlias
-from pydantic import BaseModel, Field
-from src.evaluation.models.llm_response import EvaluationLLMResponse, EvaluationElement
+from pydantic import TypeAdapter
+from src.evaluation.models.llm_response import EvaluationLLMResponse
 
 
-class EvaluationResultElement(BaseModel):
-    """チーム情報を含む評価結果要素."""
+@dataclass(slots=True, frozen=True)
+class EvaluationResultElement:
+    """チーム情報を含む評価結果要素.
 
-    player_name: str = Field(description="評価対象者の名前")
-    reasoning: str = Field(description="各評価対象に対する順位付けの理由")
-    ranking: int = Field(description="評価対象者の順位(他のプレイヤーとの重複はなし)")
-    team: str = Field(description="プレイヤーの所属チーム名")
+    LLMレスポンスの検証はEvaluationLLMResponseで完了しているため、
+    コンストラクタでは検証を行わない軽量なデータクラスとする。
+    保存済みの結果など外部データから作成する場合はfrom_dictを使用すること。
+    """
+
+    player_name: str  # 評価対象者の名前
+    reasoning: str  # 各評価対象に対する順位付けの理由
+    ranking: int  # 評価対象者の順位(他のプレイヤーとの重複はなし)
+    team: str  # プレイヤーの所属チーム名
 
     @classmethod
-    def from_evaluation_element(cls, element: EvaluationElement, team: str) -> Self:
-        """EvaluationElementからチーム情報付きの結果要素を作成
+    def from_dict(cls, data: dict) -> Self:
+        """辞書から型検証付きで結果要素を作成
+
+        Pydanticモデルと同様に型の変換・検証を行い、余分なキーは無視する。
 
         Args:
-            element: LLMからの評価要素
-            team: チーム名
+            data: 結果要素の辞書（to_dictの出力形式）
 
         Returns:
-            チーム情報付きの評価結果要素
+            評価結果要素
+
+        Raises:
+            pydantic.ValidationError: 必須項目の欠落や型が不正な場合
         """
-        return cls(
-            player_name=element.player_name,
-            reasoning=element.reasoning,
-            ranking=element.ranking,
-            team=team,
-        )
+        return _ELEMENT_ADAPTER.validate_python(data)
 
     def to_dict(self) -> dict:
         """要素を辞書形式に変換
@@ -43,6 +51,10 @@ class EvaluationResultElement(BaseModel):
         }
 
 
+# 外部データから結果要素を作成する際の検証用アダプタ
+_ELEMENT_ADAPTER = TypeAdapter(EvaluationResultElement)
+
+
 class CriteriaEvaluationResult(list[EvaluationResultElement]):
     """単一の評価基準に対する結果を表すクラス."""
 
@@ -77,13 +89,17 @@ class CriteriaEvaluationResult(list[EvaluationResultElement]):
         Returns:
             評価結果
         """
-        result_elements = []
-        for element in llm_response.rankings:
-            team = agent_to_team_mapping.get(element.player_name, "unknown")
-            result_element = EvaluationResultElement.from_evaluation_element(
-                element, team
+        # 各要素は検証済みのため、位置引数で一括して構築する
+        get_team = agent_to_team_mapping.get
+        result_elements = [
+            EvaluationResultElement(
+                element.player_name,
+                element.reasoning,
+                element.ranking,
+                get_team(element.player_name, "unknown"),
             )
-            result_elements.append(result_element)
+            for element in llm_response.rankings
+        ]
 
         return cls(criteria_name=criteria_name, elements=result_elements)
 
@@ -97,7 +113,32 @@ class CriteriaEvaluationResult(list[EvaluationResultElement]):
 
 
 class EvaluationResult(list[CriteriaEvaluationResult]):
-    """全評価基準の結果を管理するクラス（リストを継承）."""
+    """全評価基準の結果を管理するクラス（リストを継承）.
+
+    評価基準名から評価結果への索引を保持し、重複確認と検索を定数時間で行う。
+    索引はappend（add_result）とextend経由の追加でのみ更新される。
+    """
+
+    def __init__(
+        self, criteria_results: Optional[list[CriteriaEvaluationResult]] = None
+    ):
+        """初期化
+
+        Args:
+            criteria_results: 初期の評価結果のリスト
+        """
+        super().__init__()
+        self._by_name: dict[str, CriteriaEvaluationResult] = {}
+        if criteria_results:
+            self.extend(criteria_results)
+
+    def __reduce__(self):
+        """pickle・copy用に、要素から索引を再構築する形で復元する.
+
+        既定の復元処理は索引の初期化前にappend/extendを呼び出すため、
+        要素のリストを__init__に渡して作り直す。
+        """
+        return type(self), (list(self),)
 
     def append(self, criteria_result: CriteriaEvaluationResult) -> None:
         """評価結果を追加（重複チェック付き）
@@ -108,11 +149,39 @@ class EvaluationResult(list[CriteriaEvaluationResult]):
         Raises:
             ValueError: 同一のcriteria_nameが既に存在する場合
         """
-        if self.get_result_by_criteria_name(criteria_result.criteria_name) is not None:
+        criteria_name = criteria_result.criteria_name
+        if criteria_name in self._by_name:
             raise ValueError(
-                f"Criteria '{criteria_result.criteria_name}' already exists in EvaluationResult"
+                f"Criteria '{criteria_name}' already exists in EvaluationResult"
             )
         super().append(criteria_result)
+        self._by_name[criteria_name] = criteria_result
+
+    def extend(self, criteria_results: Iterable[CriteriaEvaluationResult]) -> None:
+        """評価結果をまとめて追加（重複チェック付き）
+
+        重複の確認を先にすべて行い、問題がなければ一括で追加する。
+        重複があった場合は何も追加しない。
+
+        Args:
+            criteria_results: 追加する評価結果
+
+        Raises:
+            ValueError: 同一のcriteria_nameが既に存在する、または追加分の中で重複する場合
+        """
+        criteria_results = list(criteria_results)
+        by_name = self._by_name
+        new_by_name: dict[str, CriteriaEvaluationResult] = {}
+        for criteria_result in criteria_results:
+            criteria_name = criteria_result.criteria_name
+            if criteria_name in by_name or criteria_name in new_by_name:
+                raise ValueError(
+                    f"Criteria '{criteria_name}' already exists in EvaluationResult"
+                )
+            new_by_name[criteria_name] = criteria_result
+
+        super().extend(criteria_results)
+        by_name.update(new_by_name)
 
     def add_result(self, criteria_result: CriteriaEvaluationResult) -> None:
         """評価結果を安全に追加（appendのエイリアス）
@@ -136,10 +205,7 @@ class EvaluationResult(list[CriteriaEvaluationResult]):
         Returns:
             該当する評価結果、見つからない場合はNone
         """
-        for result in self:
-            if result.criteria_name == criteria_name:
-                return result
-        return None
+        return self._by_name.get(criteria_name)
 
     def get_criteria_names(self) -> list[str]:
         """全ての評価基準名を取得
@@ -147,7 +213,7 @@ class EvaluationResult(list[CriteriaEvaluationResult]):
         Returns:
             評価基準名のリスト
         """
-        return [result.criteria_name for result in self]
+        return list(self._by_name)
 
     def to_dict(self) -> dict:
         """評価結果を辞書形式に変換
@@ -162,13 +228,15 @@ class EvaluationResult(list[CriteriaEvaluationResult]):
 
 
 # 型エイリアス定義
-TeamResultsDict: TypeAlias = dict[str, dict[str, list[EvaluationResultElement]]]
+TeamResultsDict: TypeAlias = dict[str, dict[str, array]]
 
 
 class TeamAggregator(TeamResultsDict):
     """チーム別集計データを管理するクラス
 
-    構造: {team_name: {criteria_name: [EvaluationResultElement]}}
+    構造: {team_name: {criteria_name: array('i', [ranking, ...])}}
+
+    集計に使用するのは順位のみのため、評価要素は保持せず順位を整数配列で保持する。
     """
 
     def add_game_result(self, evaluation_result: EvaluationResult) -> None:
@@ -180,19 +248,16 @@ class TeamAggregator(TeamResultsDict):
         for criteria_result in evaluation_result:
             criteria_name = criteria_result.criteria_name
 
+            # 順位をチームごとにまとめてから、配列へ一括で追加する
+            by_team: dict[str, list[int]] = {}
             for element in criteria_result:
-                team = element.team
+                by_team.setdefault(element.team, []).append(element.ranking)
 
-                # チームが存在しない場合は初期化
-                if team not in self:
-                    self[team] = {}
-
-                # 評価基準が存在しない場合は初期化
-                if criteria_name not in self[team]:
-                    self[team][criteria_name] = []
-
-                # 評価要素を追加
-                self[team][criteria_name].append(element)
+            for team, rankings in by_team.items():
+                # チーム・評価基準が存在しない場合はsetdefaultで初期化
+                self.setdefault(team, {}).setdefault(
+                    criteria_name, array("i")
+                ).extend(rankings)
 
     def calculate_team_averages(self) -> dict[str, dict[str, float]]:
         """チーム別平均順位を算出
@@ -203,14 +268,10 @@ class TeamAggregator(TeamResultsDict):
         team_averages = {}
 
         for team, criteria_dict in self.items():
-            team_averages[team] = {}
-
-            for criteria_name, elements in criteria_dict.items():
-                if elements:  # 空でない場合
-                    rankings = [element.ranking for element in elements]
-                    team_averages[team][criteria_name] = sum(rankings) / len(rankings)
-                else:
-                    team_averages[team][criteria_name] = 0.0
+            team_averages[team] = {
+                criteria_name: sum(rankings) / len(rankings) if rankings else 0.0
+                for criteria_name, rankings in criteria_dict.items()
+            }
 
         return team_averages
 
@@ -223,9 +284,9 @@ class TeamAggregator(TeamResultsDict):
         team_counts = {}
 
         for team, criteria_dict in self.items():
-            team_counts[team] = {}
-
-            for criteria_name, elements in criteria_dict.items():
-                team_counts[team][criteria_name] = len(elements)
+            team_counts[team] = {
+                criteria_name: len(rankings)
+                for criteria_name, rankings in criteria_dict.items()
+            }
 
         return team_counts
@@ -1,7 +1,5 @@
-import csv
 from pathlib import Path
 
-from src.aiwolf_log.parser import AIWolfCSVParser
 from src.game.models import GameInfo
 from src.evaluation.loaders.settings_loader import SettingsLoader
 
@@ -27,46 +25,11 @@ class GameDetector:
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        # 設定ファイルからプレイヤー数とゲーム形式を読み込み
-        player_count = SettingsLoader.load_player_count(settings_path)
-        game_format = SettingsLoader.load_game_format(settings_path)
+        # 設定ファイルからプレイヤー数とゲーム形式を一度に読み込み
+        settings = SettingsLoader.load_settings_bundle(settings_path)
 
         return GameInfo(
-            game_format=game_format,
-            player_count=player_count,
+            game_format=settings.game_format,
+            player_count=settings.player_count,
             game_id=csv_path.stem,
         )
-
-    @staticmethod
-    def _extract_player_indices(csv_path: Path) -> set[str]:
-        """CSVファイルからプレイヤーインデックスを抽出.
-
-        Args:
-            csv_path: CSVファイルのパス
-
-        Returns:
-            set[str]: プレイヤーインデックスのセット
-        """
-        player_indices = set()
-        parser = AIWolfCSVParser()
-
-        try:
-            with csv_path.open("r", encoding="utf-8") as f:
-                csv_reader = csv.reader(f)
-
-                for row in csv_reader:
-                    try:
-                        # パーサーを使用して会話行動かどうかを判定
-                        if parser._is_conversation_action(row):
-                            # パーサーを使用して発話者インデックスを取得
-                            player_index = parser.get_speaker_index(row)
-                            if player_index:  # 空文字でない場合のみ追加
-                                player_indices.add(player_index)
-                    except (TypeError, ValueError):
-                        # パーサーで処理できない行はスキップ
-                        continue
-
-        except Exception as e:
-            raise ValueError(f"Failed to read CSV file: {e}")
-
-        return player_indices
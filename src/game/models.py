@@ -9,7 +9,7 @@ class GameFormat(Enum):
     MAIN_MATCH = "main_match"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameInfo:
     """ゲーム情報を表すデータクラス."""
 
@@ -18,7 +18,7 @@ class GameInfo:
     game_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerInfo:
     """ゲーム参加者を表すデータクラス."""
 
@@ -27,7 +27,7 @@ class PlayerInfo:
     team: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterInfo:
     """キャラクター情報を表すデータクラス."""
 
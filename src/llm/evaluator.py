@@ -13,6 +13,7 @@ from openai.types.chat import (
 from pydantic import BaseModel
 
 from src.evaluation.models import EvaluationCriteria
+from src.utils.yaml_loader import YAMLLoader
 
 import yaml
 
@@ -31,17 +32,20 @@ class Evaluator:
         if not env_path.is_file():
             raise FileNotFoundError(f"環境変数ファイルが見つかりません: {env_path}")
 
-        if not prompt_yml_path.is_file():
-            raise FileNotFoundError(
-                f"プロンプトYAMLファイルが見つかりません: {prompt_yml_path}"
-            )
-
         try:
-            with open(prompt_yml_path, "r", encoding="utf-8") as f:
-                self.prompt_template = yaml.safe_load(f)
+            self.prompt_template = YAMLLoader.parse_file(
+                prompt_yml_path,
+                f"プロンプトYAMLファイルが見つかりません: {prompt_yml_path}",
+            )
         except yaml.YAMLError as e:
             raise ValueError(f"プロンプトYAMLファイルの解析に失敗しました: {e}")
 
+        # テンプレートは評価のたびにコンパイルせず、ここで一度だけ作成する
+        # developerメッセージは引数を持たないため、描画結果も保持しておく
+        developer_template = Template(self.prompt_template["developer"])
+        self._user_template = Template(self.prompt_template["user"])
+        self._developer_content = developer_template.render().strip()
+
         load_dotenv(env_path)
         api_key = os.environ.get("OPENAI_API_KEY")
 
@@ -71,12 +75,8 @@ class Evaluator:
         return response.choices[0].message.parsed
 
     def _developer_message(self) -> ChatCompletionDeveloperMessageParam:
-        template: Template = Template(self.prompt_template["developer"])
-
-        # print(template.render().strip())
-
         message: ChatCompletionDeveloperMessageParam = {
-            "content": template.render().strip(),
+            "content": self._developer_content,
             "role": "developer",
         }
         return message
@@ -87,18 +87,8 @@ class Evaluator:
         log: list[dict[str, Any]],
         character_info: str = "",
     ) -> ChatCompletionUserMessageParam:
-        template: Template = Template(self.prompt_template["user"])
-
-        # print(
-        #     template.render(
-        #         character_info=character_info,
-        #         criteria_description=criteria.description,
-        #         log=json.dumps(log, ensure_ascii=False),
-        #     ).strip()
-        # )
-
         message: ChatCompletionUserMessageParam = {
-            "content": template.render(
+            "content": self._user_template.render(
                 character_info=character_info,
                 criteria_description=criteria.description,
                 log=json.dumps(log, ensure_ascii=False),
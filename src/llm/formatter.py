@@ -62,10 +62,13 @@ class GameLogFormatter:
 
         try:
             with self.game_log.get_csv_reader(self.config) as reader:
-                while line := reader.read_next_line():
-                    formatted_line = self._process_line(line, line_number, game_format)
-                    jsonl_data.append(formatted_line)
-                    line_number += 1
+                while lines := reader.read_lines():
+                    for line in lines:
+                        formatted_line = self._process_line(
+                            line, line_number, game_format
+                        )
+                        jsonl_data.append(formatted_line)
+                        line_number += 1
 
         except Exception as e:
             raise ValueError(
@@ -129,20 +132,21 @@ class GameLogFormatter:
 
         try:
             with self.game_log.get_csv_reader(self.config) as reader:
-                while line := reader.read_next_line():
-                    parsed_data = self.parser.parse_action_data(line)
-
-                    # statusアクションからplayer_indexとplayer_nameを取得
-                    if (
-                        parsed_data.get("action") == "status"
-                        and "player_index" in parsed_data
-                        and "player_name" in parsed_data
-                    ):
-                        player_index = parsed_data["player_index"]
-                        player_name = parsed_data["player_name"]
-
-                        if player_index and player_name:
-                            mapping[player_index] = player_name
+                while lines := reader.read_lines():
+                    for line in lines:
+                        parsed_data = self.parser.parse_action_data(line)
+
+                        # statusアクションからplayer_indexとplayer_nameを取得
+                        if (
+                            parsed_data.get("action") == "status"
+                            and "player_index" in parsed_data
+                            and "player_name" in parsed_data
+                        ):
+                            player_index = parsed_data["player_index"]
+                            player_name = parsed_data["player_name"]
+
+                            if player_index and player_name:
+                                mapping[player_index] = player_name
 
         except FileNotFoundError as e:
             logger.warning(f"Log file not found: {e}")
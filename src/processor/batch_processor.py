@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from src.aiwolf_log import AIWolfGameLog
+from src.evaluation.models.config import EvaluationConfig
 from src.utils.game_log_finder import find_all_game_logs
 from src.evaluation.models.result import TeamAggregator
 
@@ -24,13 +25,19 @@ class BatchProcessor:
     処理結果の統計情報を管理する責任を持ちます。
     """
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        evaluation_config: EvaluationConfig | None = None,
+    ) -> None:
         """BatchProcessorを初期化
 
         Args:
             config: アプリケーション設定辞書
+            evaluation_config: 読み込み済みの評価設定（Noneの場合は各ゲームの処理時に読み込む）
         """
         self.config = config
+        self.evaluation_config = evaluation_config
         self.processing_config = ProcessingConfig.from_config_dict(config)
         self.aggregation_output = AggregationOutputService()
 
@@ -100,6 +107,7 @@ class BatchProcessor:
                         game_log,
                         self.config,
                         self.processing_config.output_dir,
+                        self.evaluation_config,
                     ),
                     game_log,
                 )
@@ -143,7 +151,10 @@ class BatchProcessor:
 
     @staticmethod
     def _process_single_game_worker(
-        game_log: AIWolfGameLog, config: dict[str, Any], output_dir: Path
+        game_log: AIWolfGameLog,
+        config: dict[str, Any],
+        output_dir: Path,
+        evaluation_config: EvaluationConfig | None = None,
     ) -> tuple[bool, dict | None]:
         """プロセス間で実行される単一ゲーム処理のワーカー関数
 
@@ -151,11 +162,12 @@ class BatchProcessor:
             game_log: 処理対象のゲームログ
             config: アプリケーション設定辞書
             output_dir: 出力ディレクトリ
+            evaluation_config: 読み込み済みの評価設定
 
         Returns:
             (処理が成功したかどうか, 評価結果辞書またはNone)
         """
-        processor = GameProcessor(config)
+        processor = GameProcessor(config, evaluation_config)
         return processor.process(game_log, output_dir)
 
     def _generate_team_aggregation(self, evaluation_results: list[dict]) -> None:
@@ -202,7 +214,9 @@ class BatchProcessor:
             settings_path = criteria_path.parent / "settings.yaml"
             config_with_settings["settings_path"] = str(settings_path)
 
-        data_prep_service = DataPreparationService(config_with_settings)
+        data_prep_service = DataPreparationService(
+            config_with_settings, self.evaluation_config
+        )
         evaluation_config = data_prep_service.load_evaluation_config()
 
         return {
@@ -353,29 +367,25 @@ class BatchProcessor:
             EvaluationResultElement,
         )
 
-        evaluation_result = EvaluationResult()
-
         # evaluation_dictがevaluationsフィールドを含む場合（個別結果ファイル）と
         # evaluationsの内容のみの場合（並列処理の戻り値）を判断
         evaluations_data = evaluation_dict.get("evaluations", evaluation_dict)
 
+        criteria_results = []
         for criteria_name, criteria_data in evaluations_data.items():
-            elements = []
-            for ranking_data in criteria_data.get("rankings", []):
-                element = EvaluationResultElement(
-                    player_name=ranking_data["player_name"],
-                    reasoning=ranking_data["reasoning"],
-                    ranking=ranking_data["ranking"],
-                    team=ranking_data["team"],
-                )
-                elements.append(element)
+            # 読み込んだデータは型が保証されないため、検証付きで作成する
+            elements = [
+                EvaluationResultElement.from_dict(ranking_data)
+                for ranking_data in criteria_data.get("rankings", [])
+            ]
 
             criteria_result = CriteriaEvaluationResult(
                 criteria_name=criteria_name, elements=elements
             )
-            evaluation_result.append(criteria_result)
+            criteria_results.append(criteria_result)
 
-        return evaluation_result
+        # 重複確認を一度にまとめて行い、一括で追加する
+        return EvaluationResult(criteria_results)
 
     def regenerate_aggregation_only(self) -> None:
         """既存の評価結果JSONファイルからチーム集計を再生成
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from src.aiwolf_log.game_log import AIWolfGameLog
+from src.evaluation.models.config import EvaluationConfig
 
 from .pipeline import (
     DataPreparationService,
@@ -32,11 +33,16 @@ class GameProcessor:
     SUCCESS_INDICATOR = "✓"
     FAILURE_INDICATOR = "✗"
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        evaluation_config: EvaluationConfig | None = None,
+    ) -> None:
         """GameProcessorを初期化
 
         Args:
             config: アプリケーション設定辞書
+            evaluation_config: 読み込み済みの評価設定（Noneの場合は処理時に読み込む）
 
         Raises:
             ConfigurationError: 設定が不正な場合
@@ -44,7 +50,7 @@ class GameProcessor:
         self.config = config
 
         # 各サービスを初期化
-        self.data_prep_service = DataPreparationService(config)
+        self.data_prep_service = DataPreparationService(config, evaluation_config)
         self.log_formatting_service = LogFormattingService(config)
         self.result_service = ResultWritingService()
 
@@ -9,7 +9,7 @@ from src.game.models import GameFormat
 from .exceptions import ConfigurationError
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ProcessingConfig:
     """処理設定を表すデータクラス
 
@@ -59,16 +59,20 @@ class AggregationOutputService:
                     header.append(criteria)
                 writer.writerow(header)
 
-                # 各チームのデータを書き出し
+                # 各チームのデータをまとめて書き出し
+                rows = []
                 for team in sorted(team_averages.keys()):
+                    averages = team_averages.get(team, {})
                     row = [team]
 
                     for criteria in criteria_evaluated:
                         # 平均順位（小数点第6位まで）
-                        avg = team_averages.get(team, {}).get(criteria, 0.0)
+                        avg = averages.get(criteria, 0.0)
                         row.append(f"{avg:.6f}")
 
-                    writer.writerow(row)
+                    rows.append(row)
+
+                writer.writerows(rows)
 
             logger.info(
                 f"CSV data saved with {len(team_averages)} teams and {len(criteria_evaluated)} criteria to: {csv_file_path}"
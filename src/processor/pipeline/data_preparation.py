@@ -26,11 +26,16 @@ class DataPreparationService:
 
     DEFAULT_EVALUATION_WORKERS = 8
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        evaluation_config: EvaluationConfig | None = None,
+    ) -> None:
         """初期化
 
         Args:
             config: アプリケーション設定辞書
+            evaluation_config: 読み込み済みの評価設定（Noneの場合は必要時に読み込む）
 
         Raises:
             ConfigurationError: 設定が不正な場合
@@ -41,6 +46,7 @@ class DataPreparationService:
             raise ConfigurationError("settings_path is required in configuration")
 
         self.settings_path = Path(config["settings_path"])
+        self._evaluation_config = evaluation_config
 
     def load_evaluation_config(self) -> EvaluationConfig:
         """評価設定を読み込み
@@ -51,6 +57,10 @@ class DataPreparationService:
         Raises:
             ConfigurationError: 設定読み込みに失敗した場合
         """
+        # 起動時に読み込み済みの場合は再読み込みしない
+        if self._evaluation_config is not None:
+            return self._evaluation_config
+
         try:
             criteria_path = SettingsLoader.get_evaluation_criteria_path(
                 self.settings_path
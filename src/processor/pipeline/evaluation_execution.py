@@ -37,17 +37,19 @@ class EvaluationExecutionService:
         self.max_retries = config.get("processing", {}).get("max_retries", 3)
 
     @staticmethod
-    def _extract_player_names_from_character_info(character_info: str) -> set[str]:
+    def _extract_player_names_from_character_info(
+        character_info: str,
+    ) -> frozenset[str]:
         """キャラクター情報文字列からプレイヤー名を抽出
 
         Args:
             character_info: "- agent_name: profile" 形式の文字列
 
         Returns:
-            プレイヤー名のセット
+            プレイヤー名の集合（評価基準ごとの検証で共有するため不変）
         """
         if not character_info:
-            return set()
+            return frozenset()
 
         player_names = set()
         # "- name: profile" の形式から name を抽出
@@ -56,7 +58,7 @@ class EvaluationExecutionService:
             if match:
                 player_names.add(match.group(1).strip())
 
-        return player_names
+        return frozenset(player_names)
 
     def execute_evaluations(
         self,
@@ -152,7 +154,7 @@ class EvaluationExecutionService:
         evaluator: Evaluator,
         character_info: str,
         player_count: int,
-        valid_player_names: set[str],
+        valid_player_names: frozenset[str],
         max_retries: int,
     ) -> tuple[str, EvaluationLLMResponse]:
         """単一評価基準の評価を実行（バリデーション付きで再試行）
@@ -1,8 +1,9 @@
 """ゲームログファイルの検索機能を提供するモジュール."""
 
+import os
 from pathlib import Path
 
-from src.aiwolf_log import AIWolfGameLog, AIWolfGameLogError
+from src.aiwolf_log import AIWolfGameLog
 
 
 def find_all_game_logs(input_dir: Path) -> list[AIWolfGameLog]:
@@ -16,18 +17,35 @@ def find_all_game_logs(input_dir: Path) -> list[AIWolfGameLog]:
     """
     game_logs = []
     log_dir = input_dir / "log"
+    json_dir = input_dir / "json"
 
-    if not log_dir.exists():
+    if not log_dir.is_dir() or not json_dir.is_dir():
         return game_logs
 
+    # JSONファイルの拡張子前の名前とパスを一度の走査で収集
+    with os.scandir(json_dir) as entries:
+        json_paths = {
+            entry.name[: -len(".json")]: entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        }
+
     # ログファイルをベースにペアを探す
-    for log_path in log_dir.glob("*.log"):
-        try:
-            file_name = log_path.stem
-            game_log = AIWolfGameLog.from_input_dir(input_dir, file_name)
-            game_logs.append(game_log)
-        except (FileNotFoundError, AIWolfGameLogError):
-            # 対応するJSONファイルがない場合はスキップ
-            continue
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".log") or not entry.is_file():
+                continue
+
+            json_path = json_paths.get(entry.name[: -len(".log")])
+            if json_path is None:
+                # 対応するJSONファイルがない場合はスキップ
+                continue
+
+            # 走査で得たパスをそのまま使い、存在も確認済みのため再確認しない
+            game_logs.append(
+                AIWolfGameLog.from_paths(
+                    input_dir, Path(entry.path), Path(json_path), validate=False
+                )
+            )
 
     return game_logs
@@ -1,9 +1,16 @@
 """YAML ファイル読み込み基本機能."""
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# LibYAMLが利用可能な場合はCベースのローダーを使用する（安全性はSafeLoaderと同等）
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class YAMLLoader:
     """YAMLファイルの基本読み込み機能を提供するクラス."""
@@ -12,6 +19,9 @@ class YAMLLoader:
     def load_yaml(file_path: Path) -> dict[str, Any]:
         """YAMLファイルを読み込んで辞書として返す
 
+        同じファイルは更新時刻・サイズが変わるまで解析結果をキャッシュして返す。
+        返される辞書は呼び出し間で共有されるため、変更しないこと。
+
         Args:
             file_path: YAMLファイルのパス
 
@@ -22,11 +32,87 @@ class YAMLLoader:
             FileNotFoundError: ファイルが見つからない場合
             ValueError: YAMLファイルの形式が不正な場合
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"YAML file not found: {file_path}")
+        return _load_yaml_cached(*YAMLLoader.get_cache_key(file_path))
+
+    @staticmethod
+    def parse(stream: Any) -> Any:
+        """ストリームからYAMLを解析する（キャッシュなし）
+
+        LibYAMLが利用可能な場合はCベースのローダーを使用する。
+
+        Args:
+            stream: YAMLの文字列、バイト列、またはファイルオブジェクト
+
+        Returns:
+            解析されたYAMLデータ
+
+        Raises:
+            yaml.YAMLError: YAMLの形式が不正な場合
+        """
+        return yaml.load(stream, Loader=_Loader)
+
+    @staticmethod
+    def parse_file(file_path: Path | str, not_found_message: str) -> Any:
+        """YAMLファイルを開いて解析する（キャッシュなし）
+
+        存在確認は行わず、openの失敗で兼ねる。
+
+        Args:
+            file_path: YAMLファイルのパス
+            not_found_message: ファイルが見つからない場合のエラーメッセージ
+
+        Returns:
+            解析されたYAMLデータ
+
+        Raises:
+            FileNotFoundError: ファイルが見つからない場合
+            yaml.YAMLError: YAMLの形式が不正な場合
+        """
+        try:
+            # LibYAMLにUTF-8のデコードを任せるためバイナリモードで開く
+            with open(file_path, "rb") as f:
+                return YAMLLoader.parse(f)
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(not_found_message) from None
+
+    @staticmethod
+    def get_cache_key(file_path: Path) -> tuple[str, int, int]:
+        """ファイル内容のキャッシュに使用するキーを取得
+
+        Args:
+            file_path: 対象ファイルのパス
+
+        Returns:
+            (絶対パス, 更新時刻（ナノ秒）, ファイルサイズ)
 
+        Raises:
+            FileNotFoundError: ファイルが見つからない場合
+        """
+        # statは存在確認とキャッシュキーの取得を兼ねる
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML format in {file_path}: {e}")
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"YAML file not found: {file_path}") from None
+
+        return str(file_path.absolute()), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """YAMLファイルを解析する（パス・更新時刻・サイズをキーにキャッシュ）.
+
+    Args:
+        path_str: YAMLファイルの絶対パス
+        mtime_ns: ファイルの更新時刻（ナノ秒）。キャッシュの無効化にのみ使用
+        size: ファイルサイズ。キャッシュの無効化にのみ使用
+
+    Returns:
+        読み込まれたYAMLデータの辞書
+
+    Raises:
+        ValueError: YAMLファイルの形式が不正な場合
+    """
+    try:
+        return YAMLLoader.parse_file(path_str, f"YAML file not found: {path_str}")
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format in {path_str}: {e}")
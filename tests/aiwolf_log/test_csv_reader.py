@@ -0,0 +1,85 @@
+"""AIWolfCSVReaderのテスト."""
+
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.aiwolf_log import csv_reader
+from src.aiwolf_log.csv_reader import AIWolfCSVReader
+
+CONFIG = {"processing": {"encoding": "utf-8"}}
+
+
+class TestAIWolfCSVReader(unittest.TestCase):
+    """テキストモードのcsv.readerと同じ行が得られることを確認する."""
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+
+    def write_log(self, content: bytes) -> Path:
+        path = Path(self._tmp_dir.name) / "game.log"
+        path.write_bytes(content)
+        return path
+
+    def read_all(self, path: Path) -> list[list[str]]:
+        rows = []
+        with AIWolfCSVReader(CONFIG, path) as reader:
+            # 複数回に分けて読み込み、バッチの境界もまたぐようにする
+            while lines := reader.read_lines(2):
+                rows.extend(lines)
+            self.assertIsNone(reader.read_next_line())
+        return rows
+
+    def assert_same_as_csv_reader(self, content: bytes) -> None:
+        path = self.write_log(content)
+        with open(path, encoding="utf-8") as f:
+            expected = list(csv.reader(f))
+        self.assertEqual(self.read_all(path), expected)
+
+    def test_unquoted_field_with_stray_quote(self) -> None:
+        self.assert_same_as_csv_reader(
+            b'0,talk,1,Minako,5" tall\n0,talk,2,Yumi,next\n0,talk,3,Kenji,last\n'
+        )
+
+    def test_quoted_field_with_newline(self) -> None:
+        self.assert_same_as_csv_reader(
+            b'0,talk,1,"first\nsecond",Minako\n0,talk,2,after,Yumi\n'
+        )
+
+    def test_quoted_field_with_crlf(self) -> None:
+        self.assert_same_as_csv_reader(
+            b'0,talk,1,"first\r\nsecond",Minako\r\n0,talk,2,after,Yumi\r\n'
+        )
+
+    def test_escaped_quotes(self) -> None:
+        self.assert_same_as_csv_reader(
+            b'0,talk,1,"say ""hello"", then go",Minako\n0,talk,2,plain,Yumi\n'
+        )
+
+    def test_no_trailing_newline(self) -> None:
+        self.assert_same_as_csv_reader(b"0,talk,1,first,Minako\n0,talk,2,last,Yumi")
+        self.assert_same_as_csv_reader(b'0,talk,1,first,Minako\n0,talk,2,"last",Yumi')
+
+    def test_blank_line_raises(self) -> None:
+        path = self.write_log(b"0,talk,1,first,Minako\n\n0,talk,2,last,Yumi\n")
+        with self.assertRaises(ValueError):
+            self.read_all(path)
+
+    def test_mmap_path(self) -> None:
+        content = (
+            b'0,talk,1,"first\r\nsecond",Minako\r\n'
+            b'0,talk,2,5" tall,Yumi\r\n'
+            b'0,talk,3,"say ""hi""",Kenji'
+        )
+        path = self.write_log(content)
+        with mock.patch.object(csv_reader, "MMAP_THRESHOLD", 1):
+            with AIWolfCSVReader(CONFIG, path) as reader:
+                self.assertIsNotNone(reader._mmap)
+            self.assert_same_as_csv_reader(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
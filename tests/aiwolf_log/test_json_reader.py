@@ -0,0 +1,83 @@
+"""AIWolfJSONReaderのテスト."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.aiwolf_log.json_reader import AIWolfJSONReader
+
+
+def _initialize_entry(agent: str, profile: str) -> dict:
+    request = {"request": "INITIALIZE", "info": {"agent": agent, "profile": profile}}
+    return {"request": json.dumps(request, ensure_ascii=False)}
+
+
+def _talk_entry(agent: str, text: str) -> dict:
+    request = {"request": "TALK", "info": {"agent": agent}, "text": text}
+    return {"request": json.dumps(request, ensure_ascii=False)}
+
+
+class TestAIWolfJSONReader(unittest.TestCase):
+    """ゲームJSONからの情報取得を確認する."""
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+
+    def make_reader(self, data: dict) -> AIWolfJSONReader:
+        path = Path(self._tmp_dir.name) / "game.json"
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return AIWolfJSONReader(path)
+
+    def test_repeated_initialize_keeps_last_profile(self) -> None:
+        reader = self.make_reader(
+            {
+                "agents": [
+                    {"idx": 1, "name": "team-a1", "team": "team-a"},
+                    {"idx": 2, "name": "team-b1", "team": "team-b"},
+                ],
+                "entries": [
+                    _initialize_entry("Minako", "最初のプロフィール"),
+                    _initialize_entry("Yumi", "ユミのプロフィール"),
+                    _talk_entry("Minako", "こんにちは"),
+                    _initialize_entry("Minako", "最後のプロフィール"),
+                ],
+            }
+        )
+
+        profiles = reader.get_initialize_profiles()
+        self.assertEqual(
+            profiles, {"Minako": "最後のプロフィール", "Yumi": "ユミのプロフィール"}
+        )
+        # エージェントの順序は最初の出現順のまま
+        self.assertEqual(list(profiles), ["Minako", "Yumi"])
+        self.assertEqual(
+            reader.get_agent_to_team_mapping(), {"Minako": "team-a", "Yumi": "team-b"}
+        )
+
+    def test_null_team_and_name_are_kept(self) -> None:
+        reader = self.make_reader(
+            {
+                "agents": [
+                    {"idx": 1, "name": None, "team": None},
+                    {"idx": 2, "name": "team-b1", "team": "team-b"},
+                ],
+                "entries": [
+                    _initialize_entry("Minako", "ミナコのプロフィール"),
+                    _initialize_entry("Yumi", "ユミのプロフィール"),
+                ],
+            }
+        )
+
+        self.assertEqual(
+            reader.get_agent_to_team_mapping(), {"Minako": None, "Yumi": "team-b"}
+        )
+        player_infos = reader.get_player_infos()
+        self.assertIsNone(player_infos[0].full_team_name)
+        self.assertIsNone(player_infos[0].team)
+        self.assertEqual(player_infos[1].team, "team-b")
+
+
+if __name__ == "__main__":
+    unittest.main()
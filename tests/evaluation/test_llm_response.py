@@ -0,0 +1,44 @@
+"""LLMレスポンスモデルのテスト."""
+
+import unittest
+
+from pydantic import ValidationError
+
+from src.evaluation.models.llm_response import EvaluationLLMResponse
+
+
+def _response(*rankings: int) -> EvaluationLLMResponse:
+    return EvaluationLLMResponse(
+        rankings=[
+            {"player_name": f"player{i}", "reasoning": "理由", "ranking": ranking}
+            for i, ranking in enumerate(rankings)
+        ]
+    )
+
+
+class TestValidateRankingsConsistency(unittest.TestCase):
+    """ランキングの重複と連続性の検証を確認する."""
+
+    def test_accepts_permutation(self) -> None:
+        self.assertEqual(len(_response(2, 3, 1)), 3)
+
+    def test_reports_duplicates(self) -> None:
+        # 範囲外の値の重複も、範囲内と同じく重複として報告する
+        for rankings in ((1, 1, 2), (5, 5, 5), (5, 1, 5)):
+            with self.subTest(rankings=rankings):
+                with self.assertRaisesRegex(ValidationError, "ランキング値に重複があります"):
+                    _response(*rankings)
+
+    def test_reports_non_consecutive(self) -> None:
+        for rankings in ((1, 2, 4), (4, 5, 6)):
+            with self.subTest(rankings=rankings):
+                with self.assertRaisesRegex(ValidationError, "連続した整数"):
+                    _response(*rankings)
+
+    def test_rejects_empty(self) -> None:
+        with self.assertRaisesRegex(ValidationError, "空にできません"):
+            _response()
+
+
+if __name__ == "__main__":
+    unittest.main()
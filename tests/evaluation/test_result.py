@@ -0,0 +1,112 @@
+"""評価結果モデルのテスト."""
+
+import copy
+import pickle
+import unittest
+
+from pydantic import ValidationError
+
+from src.evaluation.models.result import (
+    CriteriaEvaluationResult,
+    EvaluationResult,
+    EvaluationResultElement,
+)
+
+
+def _make_result() -> EvaluationResult:
+    return EvaluationResult(
+        [
+            CriteriaEvaluationResult(
+                "natural_expression",
+                [
+                    EvaluationResultElement("Minako", "理由A", 1, "team-a"),
+                    EvaluationResultElement("Yumi", "理由B", 2, "team-b"),
+                ],
+            ),
+            CriteriaEvaluationResult(
+                "contextual_dialogue",
+                [EvaluationResultElement("Minako", "理由C", 1, "team-a")],
+            ),
+        ]
+    )
+
+
+class TestEvaluationResultRoundTrip(unittest.TestCase):
+    """pickle・copyで内容と索引が保たれることを確認する."""
+
+    def assert_round_trip(self, original: EvaluationResult, restored) -> None:
+        self.assertIsInstance(restored, EvaluationResult)
+        self.assertEqual(restored.to_dict(), original.to_dict())
+        self.assertEqual(restored.get_criteria_names(), original.get_criteria_names())
+        self.assertEqual(
+            [r.criteria_name for r in restored],
+            [r.criteria_name for r in original],
+        )
+        # 索引が復元後の要素を指していること
+        for criteria_result in restored:
+            self.assertIs(
+                restored.get_result_by_criteria_name(criteria_result.criteria_name),
+                criteria_result,
+            )
+        # 重複チェックも引き続き機能すること
+        with self.assertRaises(ValueError):
+            restored.append(CriteriaEvaluationResult("natural_expression"))
+
+    def test_pickle(self) -> None:
+        original = _make_result()
+        self.assert_round_trip(original, pickle.loads(pickle.dumps(original)))
+
+    def test_copy(self) -> None:
+        original = _make_result()
+        self.assert_round_trip(original, copy.copy(original))
+
+    def test_deepcopy(self) -> None:
+        original = _make_result()
+        restored = copy.deepcopy(original)
+        self.assert_round_trip(original, restored)
+        self.assertIsNot(restored[0], original[0])
+
+    def test_empty(self) -> None:
+        original = EvaluationResult()
+        for restored in (pickle.loads(pickle.dumps(original)), copy.copy(original)):
+            self.assertIsInstance(restored, EvaluationResult)
+            self.assertEqual(len(restored), 0)
+            self.assertEqual(restored.get_criteria_names(), [])
+
+
+class TestEvaluationResultElementFromDict(unittest.TestCase):
+    """外部データからの結果要素の作成で型が検証されることを確認する."""
+
+    def test_coerces_and_ignores_extra_keys(self) -> None:
+        element = EvaluationResultElement.from_dict(
+            {
+                "player_name": "Minako",
+                "team": "team-a",
+                "ranking": "2",
+                "reasoning": "理由",
+                "extra": "ignored",
+            }
+        )
+        self.assertEqual(
+            element, EvaluationResultElement("Minako", "理由", 2, "team-a")
+        )
+
+    def test_rejects_invalid_values(self) -> None:
+        valid = {
+            "player_name": "Minako",
+            "team": "team-a",
+            "ranking": 1,
+            "reasoning": "理由",
+        }
+        for key, value in (("ranking", "first"), ("player_name", 1)):
+            with self.subTest(key=key), self.assertRaises(ValidationError):
+                EvaluationResultElement.from_dict({**valid, key: value})
+
+        with self.assertRaises(ValidationError):
+            EvaluationResultElement.from_dict(
+                {k: v for k, v in valid.items() if k != "team"}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()